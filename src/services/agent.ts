@@ -1,11 +1,19 @@
 import { Octokit } from '@octokit/rest';
 import { ScorecardResult, AgentConfig } from '../types';
-import { RepositoryContextService } from './repository-context';
+import { RepositoryContextService, RepoContext } from './repository-context';
 import { PromptGenerationService } from './prompt-generation';
 import { AIResponseParserService } from './ai-response-parser';
 import { AzureAIClientService } from './azure-ai-client';
 import { ScoringConfigService } from './scoring-config';
 
+/** How long fetched repository context is reused for the same repository */
+const REPO_CONTEXT_TTL_MS = 60 * 1000;
+
+interface CachedRepoContext {
+  expiresAt: number;
+  context: Promise<RepoContext>;
+}
+
 /**
  * Service for orchestrating DevEx scorecard generation using AI
  * 
@@ -17,6 +25,7 @@ export class AgentService {
   private promptService: PromptGenerationService;
   private responseParser: AIResponseParserService;
   private scoringConfig: ScoringConfigService;
+  private contextCache = new Map<string, CachedRepoContext>();
 
   constructor(config: AgentConfig) {
     this.azureAIClient = new AzureAIClientService(config);
@@ -25,39 +34,105 @@ export class AgentService {
     this.responseParser = new AIResponseParserService(this.scoringConfig);
   }
 
+  /**
+   * Get repository context, reusing a recent or in-flight fetch for the same repository
+   *
+   * Repository and installation webhooks often arrive in quick succession for the
+   * same repository; sharing the fetch avoids repeating dozens of GitHub API calls.
+   * With `refresh` set the cache is bypassed and the fresh fetch replaces any entry.
+   */
+  private getRepoContext(
+    octokit: Octokit,
+    owner: string,
+    repo: string,
+    refresh: boolean = false
+  ): Promise<RepoContext> {
+    const key = `${owner}/${repo}`;
+    const now = Date.now();
+
+    const cached = this.contextCache.get(key);
+    if (!refresh && cached && cached.expiresAt > now) {
+      console.log(`Reusing cached repository context for ${key}`);
+      return cached.context;
+    }
+
+    // Drop expired entries so the cache stays bounded by recent activity
+    for (const [cachedKey, entry] of this.contextCache) {
+      if (entry.expiresAt <= now) {
+        this.contextCache.delete(cachedKey);
+      }
+    }
 
+    const contextService = new RepositoryContextService(octokit);
+    const context = contextService.fetchRepoContext(owner, repo);
+    this.contextCache.set(key, { expiresAt: now + REPO_CONTEXT_TTL_MS, context });
+
+    // Never cache failures
+    context.catch(() => {
+      if (this.contextCache.get(key)?.context === context) {
+        this.contextCache.delete(key);
+      }
+    });
+
+    return context;
+  }
+
+  /**
+   * Clear cached repository context (useful to force a fresh analysis)
+   */
+  public clearContextCache(): void {
+    this.contextCache.clear();
+  }
 
   /**
    * Generate a developer experience scorecard using AI Foundry Agent
+   *
+   * Set `refreshContext` to analyze the repository as it is now rather than
+   * reusing recently fetched context (e.g. for an explicit re-run).
    */
   public async generateScorecard(
     octokit: Octokit,
     owner: string,
-    repo: string
+    repo: string,
+    options: { refreshContext?: boolean } = {}
   ): Promise<ScorecardResult> {
     try {
       console.log(`Generating scorecard for ${owner}/${repo} using AI Foundry Agent`);
 
-      // 1. Fetch repository context using dedicated service
-      const contextService = new RepositoryContextService(octokit);
-      const context = await contextService.fetchRepoContext(owner, repo);
+      // 1. Fetch repository context and start the AI conversation concurrently,
+      //    so agent and thread setup overlaps with GitHub I/O
+      const [contextResult, conversationResult] = await Promise.allSettled([
+        this.getRepoContext(octokit, owner, repo, options.refreshContext),
+        this.azureAIClient.startConversation(),
+      ]);
 
-      // 2. Generate analysis prompt using dedicated service
-      const prompt = this.promptService.createAnalysisPrompt(owner, repo, context);
+      if (contextResult.status === 'rejected') {
+        if (conversationResult.status === 'fulfilled') {
+          await this.azureAIClient.cleanupConversation(conversationResult.value);
+        }
+        throw contextResult.reason;
+      }
 
-      // 3. Start AI conversation
-      const conversation = await this.azureAIClient.startConversation();
+      if (conversationResult.status === 'rejected') {
+        throw conversationResult.reason;
+      }
+
+      const context = contextResult.value;
+      const conversation = conversationResult.value;
 
       try {
-        // 4. Send message and get response
+        // 2. Generate analysis prompt using dedicated service
+        const prompt = this.promptService.createAnalysisPrompt(owner, repo, context);
+
+        // 3. Send message and get response
         const aiResponse = await this.azureAIClient.sendMessage(conversation, prompt);
 
-        // 5. Parse the AI response using dedicated service
+        // 4. Parse the AI response using dedicated service
         const result = this.responseParser.parseAIResponse(aiResponse);
 
         return result;
       } finally {
-        // 6. Clean up the conversation
+        // 5. Clean up the conversation
         await this.azureAIClient.cleanupConversation(conversation);
       }
 
@@ -1,6 +1,11 @@
 import { ScorecardResult } from '../types';
 import { ScoringConfigService, defaultScoringConfig } from './scoring-config';
 
+/** Matches the outermost JSON object embedded in an AI response */
+const JSON_OBJECT_PATTERN = /\{[\s\S]*\}/;
+
+const VALID_COLORS: ReadonlyArray<ScorecardResult['color']> = ['red', 'yellow', 'green'];
+
 /**
  * Service responsible for parsing AI responses into structured results
  */
@@ -16,7 +21,7 @@ export class AIResponseParserService {
   public parseAIResponse(response: string): ScorecardResult {
     try {
       // Try to extract JSON from the response
-      const jsonMatch = response.match(/\{[\s\S]*\}/);
+      const jsonMatch = response.match(JSON_OBJECT_PATTERN);
       if (jsonMatch) {
         const parsed = JSON.parse(jsonMatch[0]);
         return this.validateAndNormalizeScorecardResult(parsed);
@@ -68,7 +73,7 @@ export class AIResponseParserService {
    */
   private determineColor(score: number, providedColor?: any): 'red' | 'yellow' | 'green' {
     // If a valid color is provided, use it
-    if (providedColor && ['red', 'yellow', 'green'].includes(providedColor)) {
+    if (providedColor && VALID_COLORS.includes(providedColor)) {
       return providedColor as 'red' | 'yellow' | 'green';
     }
 
@@ -126,7 +131,7 @@ export class AIResponseParserService {
    */
   public validateResponseStructure(response: string): boolean {
     try {
-      const jsonMatch = response.match(/\{[\s\S]*\}/);
+      const jsonMatch = response.match(JSON_OBJECT_PATTERN);
       if (!jsonMatch) return false;
       
       const parsed = JSON.parse(jsonMatch[0]);
@@ -1,6 +1,21 @@
-import { DefaultAzureCredential } from '@azure/identity';
+import {
+  AzureCliCredential,
+  ChainedTokenCredential,
+  EnvironmentCredential,
+  ManagedIdentityCredential,
+  TokenCredential,
+  WorkloadIdentityCredential,
+} from '@azure/identity';
 import { AIProjectClient } from '@azure/ai-projects';
-import { AgentsClient, Agent } from '@azure/ai-agents';
+import {
+  AgentsClient,
+  Agent,
+  ErrorEvent,
+  MessageStreamEvent,
+  RunStreamEvent,
+  ThreadMessage,
+  ThreadRun,
+} from '@azure/ai-agents';
 import { AgentConfig } from '../types';
 import { readFile } from 'fs/promises';
 import { join } from 'path';
@@ -12,6 +27,36 @@ export interface AIConversation {
   agentsClient: AgentsClient;
 }
 
+let sharedCredential: TokenCredential | undefined;
+
+/**
+ * Create a credential chain limited to the providers this bot is deployed with
+ *
+ * DefaultAzureCredential also probes Azure PowerShell and the Azure Developer CLI,
+ * each spawning a subprocess before failing; narrowing the chain avoids that
+ * startup latency. The remaining providers keep DefaultAzureCredential's order,
+ * so deployments relying on workload or managed identity keep working whatever
+ * NODE_ENV is set to.
+ */
+function createCredential(): TokenCredential {
+  return new ChainedTokenCredential(
+    new EnvironmentCredential(),
+    new WorkloadIdentityCredential(),
+    new ManagedIdentityCredential(),
+    new AzureCliCredential()
+  );
+}
+
+/**
+ * Get the process-wide Azure credential, created lazily so its token cache is shared
+ */
+function getCredential(): TokenCredential {
+  if (!sharedCredential) {
+    sharedCredential = createCredential();
+  }
+  return sharedCredential;
+}
+
 /**
  * Service responsible for managing Azure AI Foundry clients and agents
  */
@@ -21,6 +66,7 @@ export class AzureAIClientService {
   private deploymentName: string;
   private apiVersion: string;
   private agentId?: string;
+  private agentPromise?: Promise<Agent>;
   private cachedPrompt?: string;
   private scoringConfig: ScoringConfigService;
 
@@ -31,8 +77,7 @@ export class AzureAIClientService {
     this.scoringConfig = new ScoringConfigService(config.scoringConfig);
 
     // Create Azure AI Project client with proper authentication
-    const credential = new DefaultAzureCredential();
-    this.projectClient = new AIProjectClient(config.projectEndpoint, credential);
+    this.projectClient = new AIProjectClient(config.projectEndpoint, getCredential());
   }
 
   /**
@@ -46,9 +91,23 @@ export class AzureAIClientService {
   }
 
   /**
-   * Get or create the DevEx analysis agent
+   * Get or create the DevEx analysis agent, reusing it for later conversations
    */
   private async getOrCreateAgent(): Promise<Agent> {
+    if (!this.agentPromise) {
+      this.agentPromise = this.resolveAgent().catch((error) => {
+        // Allow the next conversation to retry instead of caching the failure
+        this.agentPromise = undefined;
+        throw error;
+      });
+    }
+    return this.agentPromise;
+  }
+
+  /**
+   * Look up the configured agent or create a new one
+   */
+  private async resolveAgent(): Promise<Agent> {
     const agentsClient = await this.getAgentsClient();
     
     // If agentId is provided, use existing agent
@@ -172,34 +231,89 @@ export class AzureAIClientService {
     // Add the message to the thread
     await agentsClient.messages.create(threadId, 'user', message);
 
-    // Create and execute a run with polling
-    const runPoller = agentsClient.runs.createAndPoll(threadId, agent.id, {
+    // Stream the run so completion is seen as soon as it happens instead of
+    // on the next polling interval
+    const eventStream = await agentsClient.runs.create(threadId, agent.id, {
       maxCompletionTokens: 2500,
       temperature: 0.2
-    });
+    }).stream();
 
-    // Wait for completion
-    const completedRun = await runPoller.pollUntilDone();
-    
-    if (completedRun.status !== 'completed') {
-      throw new Error(`Agent run failed with status: ${completedRun.status}`);
+    let runId: string | undefined;
+    let responseText: string | undefined;
+    let runCompleted = false;
+
+    for await (const eventMessage of eventStream) {
+      switch (eventMessage.event) {
+        case RunStreamEvent.ThreadRunCreated:
+          runId = (eventMessage.data as ThreadRun).id;
+          break;
+        case MessageStreamEvent.ThreadMessageCompleted: {
+          const text = this.extractAssistantText(eventMessage.data as ThreadMessage);
+          if (text !== undefined) {
+            responseText = text;
+          }
+          break;
+        }
+        case RunStreamEvent.ThreadRunCompleted:
+          runCompleted = true;
+          break;
+        case RunStreamEvent.ThreadRunFailed:
+        case RunStreamEvent.ThreadRunCancelled:
+        case RunStreamEvent.ThreadRunExpired:
+          throw new Error(`Agent run failed with status: ${(eventMessage.data as ThreadRun).status}`);
+        case ErrorEvent.Error:
+          throw new Error(`Agent run stream error: ${
+            typeof eventMessage.data === 'string' ? eventMessage.data : JSON.stringify(eventMessage.data)
+          }`);
+      }
+
+      // The reply is final once the run completes; stop reading the stream there
+      if (runCompleted) {
+        break;
+      }
+    }
+
+    // A stream that closes without completion (incomplete, requires_action or a
+    // dropped connection) may carry a truncated reply, so never return it
+    if (!runCompleted) {
+      throw new Error('Agent run failed: stream ended before the run completed');
+    }
+
+    if (responseText !== undefined) {
+      return responseText;
     }
 
-    // Get the messages from the thread to find the agent's response
-    const messages = agentsClient.messages.list(threadId);
+    // Fall back to reading the thread if the stream did not carry the message,
+    // asking only for this run's newest message so a single page is fetched
+    const messages = agentsClient.messages.list(threadId, {
+      runId,
+      order: 'desc',
+      limit: 1,
+    });
     
     for await (const message of messages) {
-      if (message.role === 'assistant' && message.content && message.content.length > 0) {
-        const content = message.content[0];
-        if (content.type === 'text' && 'text' in content) {
-          return (content as any).text.value;
-        }
+      const text = this.extractAssistantText(message);
+      if (text !== undefined) {
+        return text;
       }
     }
 
     throw new Error('No response from AI agent');
   }
 
+  /**
+   * Extract the text of an assistant message, if it has any
+   */
+  private extractAssistantText(message: ThreadMessage): string | undefined {
+    if (message.role === 'assistant' && message.content && message.content.length > 0) {
+      const content = message.content[0];
+      if (content.type === 'text' && 'text' in content) {
+        return (content as any).text.value;
+      }
+    }
+    return undefined;
+  }
+
   /**
    * Clean up a conversation thread
    */
@@ -3,6 +3,8 @@ import * as path from 'path';
 import { Octokit } from '@octokit/rest';
 import { createAppAuth } from '@octokit/auth-app';
 import { config } from '../config';
+import { ConditionalRequestCache, enableConditionalRequests } from './github-request-cache';
+import { enableRateLimitHandling } from './github-rate-limit';
 
 /**
  * Service responsible for GitHub authentication and Octokit instance management
@@ -10,6 +12,9 @@ import { config } from '../config';
 export class GitHubAuthService {
   private static instance: GitHubAuthService;
   private octokit: Octokit | undefined;
+  private installationOctokits = new Map<number, Octokit>();
+  // One bounded ETag cache for every client, so memory does not grow per installation
+  private requestCache = new ConditionalRequestCache();
 
   private constructor() {
     this.initializeOctokit();
@@ -59,6 +64,8 @@ export class GitHubAuthService {
           privateKey: this.getPrivateKey(),
         },
       });
+      enableConditionalRequests(this.octokit, this.requestCache, 'app');
+      enableRateLimitHandling(this.octokit);
     } catch (error) {
       if (config.nodeEnv !== 'test') {
         console.error('Failed to initialize Octokit:', error);
@@ -75,9 +82,18 @@ export class GitHubAuthService {
 
   /**
    * Get an installation-specific Octokit instance
+   *
+   * Instances are cached per installation so keep-alive connections and the
+   * installation access token (refreshed automatically by the app auth strategy)
+   * are reused across webhook events instead of being re-established each time.
    */
   public async getInstallationOctokit(installationId: number): Promise<Octokit> {
-    return new Octokit({
+    const cached = this.installationOctokits.get(installationId);
+    if (cached) {
+      return cached;
+    }
+
+    const octokit = new Octokit({
       authStrategy: createAppAuth,
       auth: {
         appId: config.githubAppId,
@@ -85,5 +101,18 @@ export class GitHubAuthService {
         installationId: installationId,
       },
     });
+    enableConditionalRequests(octokit, this.requestCache, `installation:${installationId}`);
+    enableRateLimitHandling(octokit);
+
+    this.installationOctokits.set(installationId, octokit);
+    return octokit;
+  }
+
+  /**
+   * Clear cached installation Octokit instances (useful when app credentials change)
+   */
+  public clearInstallationCache(): void {
+    this.installationOctokits.clear();
+    this.requestCache.clear();
   }
 }
\ No newline at end of file
@@ -0,0 +1,146 @@
+import { Octokit } from '@octokit/rest';
+
+export interface RateLimitOptions {
+  /** Retries for a rate-limited request before giving up */
+  maxRetries: number;
+  /** Base delay for exponential backoff when GitHub gives no retry hint */
+  baseDelayMs: number;
+  /** Remaining quota at or below which requests pause until the window resets */
+  minRemaining: number;
+  /**
+   * Longest a request will wait, so webhook handling never stalls for an hour;
+   * while a resource is paused for longer than this, its requests fail fast
+   * instead of waiting and then spending the remaining quota anyway
+   */
+  maxWaitMs: number;
+}
+
+export const DEFAULT_RATE_LIMIT_OPTIONS: RateLimitOptions = {
+  maxRetries: 3,
+  baseDelayMs: 1000,
+  minRemaining: 10,
+  maxWaitMs: 60 * 1000,
+};
+
+type ResponseHeaders = { [header: string]: string | number | undefined };
+
+const sleep = (ms: number): Promise<void> => new Promise(resolve => setTimeout(resolve, ms));
+
+/**
+ * Milliseconds until the rate limit window in the response headers resets
+ */
+function getResetDelayMs(headers: ResponseHeaders): number | undefined {
+  const resetSeconds = Number(headers['x-ratelimit-reset']);
+  if (!resetSeconds) {
+    return undefined;
+  }
+  return Math.max(0, resetSeconds * 1000 - Date.now());
+}
+
+/**
+ * The rate limit bucket a request draws from, matching GitHub's `x-ratelimit-resource`
+ */
+function getRequestResource(url: string): string {
+  if (url === '/graphql') {
+    return 'graphql';
+  }
+  return url.startsWith('/search/') ? 'search' : 'core';
+}
+
+/**
+ * Whether a failed request was rejected by GitHub's primary or secondary rate limit
+ */
+function isRateLimitError(status: number | undefined, headers: ResponseHeaders, message: string): boolean {
+  if (status === 429) {
+    return true;
+  }
+  return status === 403 && (
+    String(headers['x-ratelimit-remaining']) === '0' ||
+    headers['retry-after'] !== undefined ||
+    message.toLowerCase().includes('rate limit')
+  );
+}
+
+/**
+ * Make an Octokit instance pace itself against the GitHub rate limit and retry
+ * rate-limited requests with exponential backoff
+ *
+ * Without this, a rate-limited file fetch is reported as a missing file and the
+ * scorecard is generated from incomplete context.
+ */
+export function enableRateLimitHandling(
+  octokit: Octokit,
+  options: RateLimitOptions = DEFAULT_RATE_LIMIT_OPTIONS
+): void {
+  // Shared by every request made through this client, keyed by rate limit
+  // resource since REST, GraphQL and search quotas are tracked separately
+  const pausedUntil = new Map<string, number>();
+
+  octokit.hook.wrap('request', async (request, requestOptions) => {
+    const requestResource = getRequestResource(requestOptions.url);
+
+    for (let attempt = 0; ; attempt++) {
+      const pause = (pausedUntil.get(requestResource) ?? 0) - Date.now();
+      if (pause > options.maxWaitMs) {
+        throw new Error(`GitHub ${requestResource} rate limit paused for another ${Math.ceil(pause / 1000)}s, not sending ${requestOptions.method} ${requestOptions.url}`);
+      }
+      if (pause > 0) {
+        await sleep(pause);
+      }
+
+      try {
+        const response = await request(requestOptions);
+
+        const remaining = Number(response.headers['x-ratelimit-remaining']);
+        if (!isNaN(remaining) && remaining <= options.minRemaining) {
+          const resetDelay = getResetDelayMs(response.headers);
+          if (resetDelay) {
+            const resource = String(response.headers['x-ratelimit-resource'] ?? requestResource);
+            console.warn(`GitHub ${resource} rate limit nearly exhausted (${remaining} remaining), pausing requests for ${Math.ceil(resetDelay / 1000)}s`);
+            pausedUntil.set(resource, Date.now() + resetDelay);
+          }
+        }
+
+        return response;
+      } catch (error) {
+        const { status, response, message } = error as {
+          status?: number;
+          response?: { headers?: ResponseHeaders };
+          message?: string;
+        };
+        const headers = response?.headers ?? {};
+
+        if (!isRateLimitError(status, headers, message ?? '')) {
+          throw error;
+        }
+
+        // An exhausted primary quota cannot recover before the reset, so hold back
+        // every request on this resource until then, and give up at once when the
+        // reset is further away than we are willing to wait
+        const quotaExhausted = String(headers['x-ratelimit-remaining']) === '0';
+        const resetDelay = quotaExhausted ? getResetDelayMs(headers) : undefined;
+        if (resetDelay !== undefined) {
+          const resource = String(headers['x-ratelimit-resource'] ?? requestResource);
+          pausedUntil.set(resource, Date.now() + resetDelay);
+          if (resetDelay > options.maxWaitMs) {
+            throw error;
+          }
+        }
+
+        if (attempt >= options.maxRetries) {
+          throw error;
+        }
+
+        // Prefer GitHub's own hints: retry-after for secondary limits, the reset
+        // time when the primary quota is exhausted, otherwise exponential backoff
+        const retryAfterSeconds = Number(headers['retry-after']);
+        const delay = retryAfterSeconds > 0
+          ? retryAfterSeconds * 1000
+          : resetDelay ?? options.baseDelayMs * 2 ** attempt;
+
+        console.warn(`GitHub rate limit hit for ${requestOptions.method} ${requestOptions.url}, retrying in ${Math.min(delay, options.maxWaitMs)}ms (attempt ${attempt + 1}/${options.maxRetries})`);
+        await sleep(Math.min(delay, options.maxWaitMs));
+      }
+    }
+  });
+}
@@ -58,6 +58,40 @@ export interface DirectoryStructure {
   docsDirectories: string[];
 }
 
+export interface GitTreeEntry {
+  path: string;
+  type: string;
+  sha: string;
+}
+
+/** Maximum number of blob contents kept in memory */
+const MAX_CACHED_BLOBS = 1000;
+
+/** Blob contents keyed by SHA; blobs are immutable so entries never go stale */
+const blobCache = new Map<string, string>();
+
+/**
+ * Build the GraphQL query fetching each file as an aliased blob field
+ */
+function buildFilesQuery(filenames: readonly string[]): string {
+  const fileFields = filenames
+    .map((filename, index) => `file${index}: object(expression: ${JSON.stringify(`HEAD:${filename}`)}) { ... on Blob { text } }`)
+    .join('\n');
+  return `query($owner: String!, $repo: String!) {
+    repository(owner: $owner, name: $repo) {
+      ${fileFields}
+    }
+  }`;
+}
+
+function getErrorStatus(error: unknown): number | undefined {
+  return (error as { status?: number })?.status;
+}
+
+function getErrorMessage(error: unknown): string {
+  return error instanceof Error ? error.message : String(error);
+}
+
 /**
  * Service responsible for fetching GitHub repository data
  */
@@ -78,32 +112,45 @@ export class GitHubRepositoryService {
         return null;
       }
       
+      // Request the raw media type so GitHub returns the file body directly,
+      // avoiding a JSON envelope and base64 decode on our side
       const response = await this.octokit.rest.repos.getContent({
         owner,
         repo,
         path: filename,
+        mediaType: { format: 'raw' },
       });
 
-      if ('content' in response.data && response.data.content) {
-        return Buffer.from(response.data.content, 'base64').toString('utf-8');
-      }
-
-      return null;
+      const content = response.data as unknown;
+      return typeof content === 'string' ? content : null;
     } catch (error) {
-      console.log(`File ${filename} not found in ${owner}/${repo}`);
+      // Most candidate files are optional, so 404s are expected and not worth logging
+      if (getErrorStatus(error) !== 404) {
+        console.warn(`Failed to fetch file ${filename} from ${owner}/${repo}: ${getErrorMessage(error)}`);
+      }
       return null;
     }
   }
 
   /**
-   * Fetch multiple files in parallel
+   * Fetch multiple files, using a single GraphQL query with a REST fallback
    */
   public async fetchFiles(
     owner: string,
     repo: string,
-    filenames: string[]
+    filenames: readonly string[]
   ): Promise<GitHubFileContent[]> {
     console.log(`Fetching ${filenames.length} files from ${owner}/${repo}...`);
+
+    const graphqlResults = await this.fetchFilesGraphQL(owner, repo, filenames);
+    if (graphqlResults) {
+      return graphqlResults;
+    }
+
+    const treeResults = await this.fetchFilesFromTree(owner, repo, filenames);
+    if (treeResults) {
+      return treeResults;
+    }
     
     const filePromises = filenames.map(async (filename) => {
       const content = await this.fetchFile(owner, repo, filename);
@@ -113,6 +160,148 @@ export class GitHubRepositoryService {
     return await Promise.all(filePromises);
   }
 
+  /**
+   * Fetch multiple files in one round trip via GraphQL
+   *
+   * Each file is requested as an aliased `object(expression: "HEAD:<path>")` field,
+   * so missing files cost nothing extra. Returns null when GraphQL is unavailable
+   * or the query fails, letting callers fall back to per-file REST requests.
+   */
+  private async fetchFilesGraphQL(
+    owner: string,
+    repo: string,
+    filenames: readonly string[]
+  ): Promise<GitHubFileContent[] | null> {
+    if (!this.octokit?.graphql || filenames.length === 0) {
+      return null;
+    }
+
+    try {
+      const response = await this.octokit.graphql<{
+        repository: Record<string, { text?: string | null } | null> | null;
+      }>(buildFilesQuery(filenames), { owner, repo });
+
+      const repository = response.repository;
+      if (!repository) {
+        return null;
+      }
+
+      return filenames.map((filename, index) => ({
+        filename,
+        content: repository[`file${index}`]?.text ?? null,
+      }));
+    } catch (error) {
+      console.warn(`GraphQL file fetch failed for ${owner}/${repo}, falling back to REST: ${getErrorMessage(error)}`);
+      return null;
+    }
+  }
+
+  /**
+   * Fetch multiple files via the Git Data API
+   *
+   * One recursive tree request tells us which files exist, so only present files
+   * are fetched (as blobs by SHA) instead of probing every candidate path.
+   * Returns null when the tree is unavailable or truncated.
+   */
+  private async fetchFilesFromTree(
+    owner: string,
+    repo: string,
+    filenames: readonly string[]
+  ): Promise<GitHubFileContent[] | null> {
+    const tree = await this.fetchTree(owner, repo);
+    if (!tree) {
+      return null;
+    }
+
+    const blobShas = new Map(
+      tree.filter(entry => entry.type === 'blob').map(entry => [entry.path, entry.sha])
+    );
+
+    return await Promise.all(filenames.map(async (filename) => {
+      const sha = blobShas.get(filename);
+      const content = sha ? await this.fetchBlob(owner, repo, sha) : null;
+      return { filename, content };
+    }));
+  }
+
+  /**
+   * Fetch the recursive tree for the default branch HEAD
+   */
+  public async fetchTree(
+    owner: string,
+    repo: string
+  ): Promise<GitTreeEntry[] | null> {
+    try {
+      if (!this.octokit?.rest?.git?.getTree) {
+        return null;
+      }
+
+      const response = await this.octokit.rest.git.getTree({
+        owner,
+        repo,
+        tree_sha: 'HEAD',
+        recursive: 'true',
+      });
+
+      // A truncated listing cannot tell us which files are missing
+      if (response.data.truncated) {
+        return null;
+      }
+
+      return response.data.tree
+        .filter(entry => entry.path && entry.type && entry.sha)
+        .map(entry => ({
+          path: entry.path as string,
+          type: entry.type as string,
+          sha: entry.sha as string,
+        }));
+    } catch (error) {
+      console.warn(`Failed to fetch tree for ${owner}/${repo}: ${getErrorMessage(error)}`);
+      return null;
+    }
+  }
+
+  /**
+   * Fetch blob content by SHA, served from the in-process cache when possible
+   */
+  public async fetchBlob(
+    owner: string,
+    repo: string,
+    sha: string
+  ): Promise<string | null> {
+    const cached = blobCache.get(sha);
+    if (cached !== undefined) {
+      return cached;
+    }
+
+    try {
+      const response = await this.octokit.rest.git.getBlob({
+        owner,
+        repo,
+        file_sha: sha,
+        mediaType: { format: 'raw' },
+      });
+
+      const content = response.data as unknown;
+      if (typeof content !== 'string') {
+        return null;
+      }
+
+      blobCache.set(sha, content);
+      if (blobCache.size > MAX_CACHED_BLOBS) {
+        const oldestSha = blobCache.keys().next().value;
+        if (oldestSha !== undefined) {
+          blobCache.delete(oldestSha);
+        }
+      }
+
+      return content;
+    } catch (error) {
+      console.warn(`Failed to fetch blob ${sha} from ${owner}/${repo}: ${getErrorMessage(error)}`);
+      return null;
+    }
+  }
+
   /**
    * Fetch directory listing from GitHub repository
    */
@@ -139,7 +328,9 @@ export class GitHubRepositoryService {
 
       return [];
     } catch (error) {
-      console.log(`Directory ${path} not found in ${owner}/${repo}`);
+      if (getErrorStatus(error) !== 404) {
+        console.warn(`Failed to fetch directory ${path} from ${owner}/${repo}: ${getErrorMessage(error)}`);
+      }
       return [];
     }
   }
@@ -186,7 +377,7 @@ export class GitHubRepositoryService {
         } : undefined,
       };
     } catch (error) {
-      console.error(`Error fetching repository metadata for ${owner}/${repo}:`, error);
+      console.error(`Error fetching repository metadata for ${owner}/${repo}: ${getErrorMessage(error)}`);
       return null;
     }
   }
@@ -218,7 +409,7 @@ export class GitHubRepositoryService {
         date: commit.commit.author?.date || '',
       }));
     } catch (error) {
-      console.error(`Error fetching commits for ${owner}/${repo}:`, error);
+      console.error(`Error fetching commits for ${owner}/${repo}: ${getErrorMessage(error)}`);
       return [];
     }
   }
@@ -250,7 +441,7 @@ export class GitHubRepositoryService {
         labels: pr.labels.map(label => label.name),
       }));
     } catch (error) {
-      console.error(`Error fetching pull requests for ${owner}/${repo}:`, error);
+      console.error(`Error fetching pull requests for ${owner}/${repo}: ${getErrorMessage(error)}`);
       return [];
     }
   }
@@ -286,7 +477,7 @@ export class GitHubRepositoryService {
           labels: issue.labels.map(label => typeof label === 'string' ? label : label.name).filter((name): name is string => name !== undefined),
         }));
     } catch (error) {
-      console.error(`Error fetching issues for ${owner}/${repo}:`, error);
+      console.error(`Error fetching issues for ${owner}/${repo}: ${getErrorMessage(error)}`);
       return [];
     }
   }
@@ -333,7 +524,7 @@ export class GitHubRepositoryService {
         docsDirectories,
       };
     } catch (error) {
-      console.error(`Error analyzing directory structure for ${owner}/${repo}:`, error);
+      console.error(`Error analyzing directory structure for ${owner}/${repo}: ${getErrorMessage(error)}`);
       return {
         rootFiles: [],
         directories: [],
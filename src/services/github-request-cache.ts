@@ -0,0 +1,102 @@
+import { Octokit } from '@octokit/rest';
+
+interface CachedResponse {
+  etag: string;
+  response: any;
+}
+
+/**
+ * In-memory store of GitHub GET responses keyed by media type and URL
+ *
+ * Entries are always revalidated with `If-None-Match`, so cached data is never
+ * served stale; a `304 Not Modified` answer skips the body transfer and does not
+ * count against the GitHub API rate limit.
+ */
+export class ConditionalRequestCache {
+  private entries = new Map<string, CachedResponse>();
+
+  constructor(private maxEntries: number = 500) {}
+
+  /**
+   * Get a cached response, marking it as most recently used
+   */
+  public get(key: string): CachedResponse | undefined {
+    const entry = this.entries.get(key);
+    if (entry) {
+      this.entries.delete(key);
+      this.entries.set(key, entry);
+    }
+    return entry;
+  }
+
+  /**
+   * Store a response, evicting the least recently used entry when full
+   */
+  public set(key: string, entry: CachedResponse): void {
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+
+    if (this.entries.size > this.maxEntries) {
+      const oldestKey = this.entries.keys().next().value;
+      if (oldestKey !== undefined) {
+        this.entries.delete(oldestKey);
+      }
+    }
+  }
+
+  public get size(): number {
+    return this.entries.size;
+  }
+
+  public clear(): void {
+    this.entries.clear();
+  }
+}
+
+/**
+ * Make an Octokit instance issue conditional GET requests backed by an ETag cache
+ *
+ * Clients sharing one cache pass a distinct `scope` (e.g. the installation id) so
+ * a response is only ever served back to the credentials that fetched it.
+ */
+export function enableConditionalRequests(
+  octokit: Octokit,
+  cache: ConditionalRequestCache = new ConditionalRequestCache(),
+  scope: string = ''
+): void {
+  octokit.hook.wrap('request', async (request, options) => {
+    if (options.method !== 'GET') {
+      return request(options);
+    }
+
+    // `request` may be another hook (e.g. the app auth strategy) bound over the
+    // real request function, so it has no `endpoint`; parse with the client's own
+    const { url, headers } = octokit.request.endpoint.parse(options);
+    const key = `${scope} ${headers.accept} ${url}`;
+    const cached = cache.get(key);
+
+    if (cached) {
+      options.headers['if-none-match'] = cached.etag;
+    }
+
+    try {
+      const response = await request(options);
+      const etag = response.headers.etag;
+      if (etag) {
+        cache.set(key, { etag, response });
+      }
+      return response;
+    } catch (error) {
+      // Octokit surfaces 304 Not Modified as a RequestError. Serve the cached body
+      // with the 304's own headers, so rate-limit pacing sees the current quota.
+      const { status, response } = error as { status?: number; response?: { headers?: object } };
+      if (cached && status === 304) {
+        return {
+          ...cached.response,
+          headers: { ...cached.response.headers, ...response?.headers },
+        };
+      }
+      throw error;
+    }
+  });
+}
@@ -1,5 +1,5 @@
 import { Octokit } from '@octokit/rest';
-import { Repository, Issue, AgentConfig } from '../types';
+import { Repository, Issue, AgentConfig, ScorecardResult } from '../types';
 import { DEVEX_SCORECARD_TEMPLATE, generateScorecardRerunComment } from './scorecard-template';
 import { generateAIScorecardTemplate, generateAIScorecardRerunComment } from './ai-scorecard-template';
 import { GitHubAuthService } from './github-auth';
@@ -14,11 +14,11 @@ import { ScoringConfigService } from './scoring-config';
 export class IssueManagerService {
   private githubAuth: GitHubAuthService;
   private agentService?: AgentService;
-  private azureConfig?: AgentConfig;
+  private scoringConfig: ScoringConfigService;
 
   constructor(azureConfig?: AgentConfig) {
     this.githubAuth = GitHubAuthService.getInstance();
-    this.azureConfig = azureConfig;
+    this.scoringConfig = new ScoringConfigService(azureConfig?.scoringConfig);
     
     // Initialize AI agent service if Azure configuration is provided
     if (azureConfig) {
@@ -27,10 +27,36 @@ export class IssueManagerService {
   }
 
   /**
-   * Get scoring configuration service
+   * Generate the scorecard issue body, using AI analysis when available
+   *
+   * Falls back to the static template when AI is not configured or the analysis fails.
    */
-  private getScoringConfig(): ScoringConfigService {
-    return new ScoringConfigService(this.azureConfig?.scoringConfig);
+  private async generateScorecardContent(
+    octokitInstance: Octokit,
+    repository: Repository,
+    options: { refreshContext?: boolean } = {}
+  ): Promise<{ issueBody: string; aiResult?: ScorecardResult }> {
+    if (!this.agentService) {
+      console.log(`AI service not configured, using static template for ${repository.full_name}`);
+      return { issueBody: DEVEX_SCORECARD_TEMPLATE };
+    }
+
+    try {
+      const aiResult = await this.agentService.generateScorecard(
+        octokitInstance,
+        repository.owner.login,
+        repository.name,
+        options
+      );
+      console.log(`AI analysis completed for ${repository.full_name} - Score: ${aiResult.score}`);
+      return {
+        issueBody: generateAIScorecardTemplate(aiResult, this.scoringConfig, repository),
+        aiResult,
+      };
+    } catch (error) {
+      console.error(`AI analysis failed for ${repository.full_name}, using static template:`, error);
+      return { issueBody: DEVEX_SCORECARD_TEMPLATE };
+    }
   }
 
   /**
@@ -63,23 +89,7 @@ export class IssueManagerService {
   public async createAIScorecardIssue(octokitInstance: Octokit, repository: Repository): Promise<any> {
     console.log(`Creating new AI-powered scorecard issue for ${repository.full_name}`);
     
-    let issueBody = DEVEX_SCORECARD_TEMPLATE; // Fallback to static template
-    
-    if (this.agentService) {
-      try {
-        const aiResult = await this.agentService.generateScorecard(
-          octokitInstance,
-          repository.owner.login,
-          repository.name
-        );
-        issueBody = generateAIScorecardTemplate(aiResult, this.getScoringConfig(), repository);
-        console.log(`AI analysis completed for ${repository.full_name} - Score: ${aiResult.score}`);
-      } catch (error) {
-        console.error(`AI analysis failed for ${repository.full_name}, using static template:`, error);
-      }
-    } else {
-      console.log(`AI service not configured, using static template for ${repository.full_name}`);
-    }
+    const { issueBody } = await this.generateScorecardContent(octokitInstance, repository);
     
     const issue = await octokitInstance.rest.issues.create({
       owner: repository.owner.login,
@@ -104,23 +114,7 @@ export class IssueManagerService {
   ): Promise<any> {
     console.log(`Updating existing scorecard issue #${issueNumber} for ${repository.full_name} with AI analysis`);
     
-    let issueBody = DEVEX_SCORECARD_TEMPLATE; // Fallback to static template
-    
-    if (this.agentService) {
-      try {
-        const aiResult = await this.agentService.generateScorecard(
-          octokitInstance,
-          repository.owner.login,
-          repository.name
-        );
-        issueBody = generateAIScorecardTemplate(aiResult, this.getScoringConfig(), repository);
-        console.log(`AI analysis completed for ${repository.full_name} - Score: ${aiResult.score}`);
-      } catch (error) {
-        console.error(`AI analysis failed for ${repository.full_name}, using static template:`, error);
-      }
-    } else {
-      console.log(`AI service not configured, using static template for ${repository.full_name}`);
-    }
+    const { issueBody } = await this.generateScorecardContent(octokitInstance, repository);
     
     const updateData: any = {
       owner: repository.owner.login,
@@ -193,25 +187,15 @@ export class IssueManagerService {
     // Get installation-specific Octokit instance
     const installationOctokit = await this.githubAuth.getInstallationOctokit(installationId);
     
-    let issueBody = DEVEX_SCORECARD_TEMPLATE;
-    let commentBody = generateScorecardRerunComment();
-    
-    if (this.agentService) {
-      try {
-        const aiResult = await this.agentService.generateScorecard(
-          installationOctokit,
-          repository.owner.login,
-          repository.name
-        );
-        issueBody = generateAIScorecardTemplate(aiResult, this.getScoringConfig(), repository);
-        commentBody = generateAIScorecardRerunComment(aiResult);
-        console.log(`AI re-analysis completed for ${repository.full_name} - Score: ${aiResult.score}`);
-      } catch (error) {
-        console.error(`AI re-analysis failed for ${repository.full_name}, using static template:`, error);
-      }
-    } else {
-      console.log(`AI service not configured, using static template for ${repository.full_name}`);
-    }
+    // A re-run is an explicit request for fresh analysis, so never reuse cached context
+    const { issueBody, aiResult } = await this.generateScorecardContent(
+      installationOctokit,
+      repository,
+      { refreshContext: true }
+    );
+    const commentBody = aiResult
+      ? generateAIScorecardRerunComment(aiResult)
+      : generateScorecardRerunComment();
     
     // Regenerate the scorecard by updating the issue with fresh analysis
     await installationOctokit.rest.issues.update({
@@ -71,6 +71,55 @@ export interface RepoContext {
   [key: string]: any;
 }
 
+/**
+ * Candidate files fetched for every repository, built once at module load
+ */
+const REPO_CONTEXT_FILES: readonly string[] = [
+  // Core files
+  'README.md',
+  'CODEOWNERS',
+  '.gitignore',
+  // Optional documentation
+  'CONTRIBUTING.md',
+  'CODE_OF_CONDUCT.md',
+  'SECURITY.md',
+  'LICENSE',
+  'LICENSE.md',
+  'LICENSE.txt',
+  // Project configuration
+  'package.json',
+  'composer.json',
+  'requirements.txt',
+  'Pipfile',
+  'pom.xml',
+  'build.gradle',
+  'Cargo.toml',
+  'go.mod',
+  // Infrastructure
+  'Dockerfile',
+  'docker-compose.yml',
+  'docker-compose.yaml',
+  '.dockerignore',
+  // Testing and quality
+  'jest.config.js',
+  'jest.config.ts',
+  'pytest.ini',
+  'phpunit.xml',
+  '.eslintrc.json',
+  '.eslintrc.js',
+  'tslint.json',
+  'sonar-project.properties',
+  'codecov.yml',
+  '.travis.yml',
+  // Development environment
+  '.env.example',
+  'Vagrantfile',
+  '.devcontainer/devcontainer.json',
+  'devcontainer.json',
+  // GitHub templates
+  '.github/PULL_REQUEST_TEMPLATE.md',
+];
+
 /**
  * Service responsible for aggregating comprehensive repository context
  */
@@ -92,67 +141,10 @@ export class RepositoryContextService {
     
     const context: RepoContext = {} as RepoContext;
 
-    // Define file categories
-    const coreFiles = ['README.md', 'CODEOWNERS', '.gitignore'];
-    const optionalDocs = [
-      'CONTRIBUTING.md',
-      'CODE_OF_CONDUCT.md',
-      'SECURITY.md',
-      'LICENSE',
-      'LICENSE.md',
-      'LICENSE.txt',
-    ];
-    const configFiles = [
-      'package.json',
-      'composer.json',
-      'requirements.txt',
-      'Pipfile',
-      'pom.xml',
-      'build.gradle',
-      'Cargo.toml',
-      'go.mod',
-    ];
-    const infraFiles = [
-      'Dockerfile',
-      'docker-compose.yml',
-      'docker-compose.yaml',
-      '.dockerignore',
-    ];
-    const testingFiles = [
-      'jest.config.js',
-      'jest.config.ts',
-      'pytest.ini',
-      'phpunit.xml',
-      '.eslintrc.json',
-      '.eslintrc.js',
-      'tslint.json',
-      'sonar-project.properties',
-      'codecov.yml',
-      '.travis.yml',
-    ];
-    const devFiles = [
-      '.env.example',
-      'Vagrantfile',
-      '.devcontainer/devcontainer.json',
-      'devcontainer.json',
-    ];
-    const githubFiles = [
-      '.github/PULL_REQUEST_TEMPLATE.md',
-    ];
-
-    // Fetch all files in parallel
-    const allFiles = [...coreFiles, ...optionalDocs, ...configFiles, ...infraFiles, ...testingFiles, ...devFiles, ...githubFiles];
-    const fileResults = await this.githubRepoService.fetchFiles(owner, repo, allFiles);
-    
-    // Process file results
-    fileResults.forEach(({ filename, content }) => {
-      if (content !== null) {
-        context[filename] = content;
-      }
-    });
-
-    // Fetch additional GitHub-specific data in parallel
+    // Fetch files and additional GitHub-specific data in a single parallel batch
+    // so total latency is bounded by the slowest request rather than their sum
     const [
+      fileResults,
       workflowInfo,
       issueTemplates,
       repositoryInfo,
@@ -161,6 +153,7 @@ export class RepositoryContextService {
       recentIssues,
       directoryStructure
     ] = await Promise.all([
+      this.githubRepoService.fetchFiles(owner, repo, REPO_CONTEXT_FILES),
       this.githubRepoService.fetchWorkflowInfo(owner, repo),
       this.githubRepoService.fetchIssueTemplates(owner, repo),
       this.githubRepoService.fetchRepositoryMetadata(owner, repo),
@@ -170,6 +163,13 @@ export class RepositoryContextService {
       this.githubRepoService.analyzeDirectoryStructure(owner, repo)
     ]);
 
+    // Process file results
+    fileResults.forEach(({ filename, content }) => {
+      if (content !== null) {
+        context[filename] = content;
+      }
+    });
+
     // Add workflow information
     Object.assign(context, workflowInfo);
     
@@ -1,6 +1,7 @@
 // Mock the dependencies before requiring the app
 jest.mock('@octokit/rest', () => ({
   Octokit: jest.fn().mockImplementation(() => ({
+    hook: { wrap: jest.fn() },
     rest: {
       issues: {
         create: jest.fn(),
@@ -25,9 +26,13 @@ jest.mock('fs', () => ({
 
 // Mock Azure AI dependencies to prevent real network calls
 jest.mock('@azure/identity', () => ({
-  DefaultAzureCredential: jest.fn().mockImplementation(() => ({
+  AzureCliCredential: jest.fn(),
+  ChainedTokenCredential: jest.fn().mockImplementation(() => ({
     getToken: jest.fn().mockResolvedValue({ token: 'mock-token' }),
   })),
+  EnvironmentCredential: jest.fn(),
+  ManagedIdentityCredential: jest.fn(),
+  WorkloadIdentityCredential: jest.fn(),
 }));
 
 const mockAgentsClient = {
@@ -55,6 +60,7 @@ jest.mock('@azure/ai-agents', () => ({
 
 import request from 'supertest';
 import { createApp, startServer } from '../src/server';
+import { GitHubAuthService } from '../src/services/github-auth';
 
 describe('DevEx Scorecard Generator Bot', () => {
   const app = createApp();
@@ -94,6 +100,11 @@ describe('DevEx Scorecard Generator Bot', () => {
   });
 
   describe('POST /webhook', () => {
+    beforeEach(() => {
+      // Each test mocks Octokit differently, so drop clients cached by earlier tests
+      GitHubAuthService.getInstance().clearInstallationCache();
+    });
+
     it('should reject requests without signature', async () => {
       const response = await request(app)
         .post('/webhook')
@@ -162,6 +173,7 @@ describe('DevEx Scorecard Generator Bot', () => {
       
       // Mock both the global Octokit and instance-specific ones
       (Octokit as jest.Mock).mockImplementation(() => ({
+        hook: { wrap: jest.fn() },
         rest: {
           issues: {
             create: mockCreateIssue,
@@ -232,6 +244,7 @@ describe('DevEx Scorecard Generator Bot', () => {
       
       // Mock both the global Octokit and instance-specific ones
       (Octokit as jest.Mock).mockImplementation(() => ({
+        hook: { wrap: jest.fn() },
         rest: {
           issues: {
             create: jest.fn(),
@@ -298,6 +311,7 @@ describe('DevEx Scorecard Generator Bot', () => {
       const mockListForRepo = jest.fn().mockResolvedValue({ data: [] }); // Mock empty issues list
       
       (Octokit as jest.Mock).mockImplementation(() => ({
+        hook: { wrap: jest.fn() },
         rest: {
           issues: {
             create: jest.fn(),
@@ -1,5 +1,6 @@
 import { AgentService } from '../../src/services/agent';
 import { Octokit } from '@octokit/rest';
+import { DoneEvent, MessageStreamEvent, RunStreamEvent } from '@azure/ai-agents';
 
 // Mock Azure AI Agents
 const mockCreateAgent = jest.fn();
@@ -7,7 +8,7 @@ const mockGetAgent = jest.fn();
 const mockCreateThread = jest.fn();
 const mockCreateMessage = jest.fn();
 const mockDeleteThread = jest.fn();
-const mockCreateAndPoll = jest.fn();
+const mockCreateRun = jest.fn();
 const mockListMessages = jest.fn();
 
 const mockAgentsClient = {
@@ -22,10 +23,26 @@ const mockAgentsClient = {
     list: mockListMessages,
   },
   runs: {
-    createAndPoll: mockCreateAndPoll,
+    create: mockCreateRun,
   },
 };
 
+// Mock a streamed run that emits a completed event for each message, then finishes
+const mockRunStream = (messages: any[]) => {
+  mockCreateRun.mockReturnValue({
+    stream: jest.fn().mockResolvedValue({
+      [Symbol.asyncIterator]: async function* () {
+        yield { event: RunStreamEvent.ThreadRunCreated, data: { id: 'run-abc', status: 'queued' } };
+        for (const message of messages) {
+          yield { event: MessageStreamEvent.ThreadMessageCompleted, data: message };
+        }
+        yield { event: RunStreamEvent.ThreadRunCompleted, data: { id: 'run-abc', status: 'completed' } };
+        yield { event: DoneEvent.Done, data: '[DONE]' };
+      },
+    }),
+  });
+};
+
 jest.mock('@azure/ai-projects', () => ({
   AIProjectClient: jest.fn().mockImplementation(() => ({
     agents: mockAgentsClient,
@@ -33,7 +50,11 @@ jest.mock('@azure/ai-projects', () => ({
 }));
 
 jest.mock('@azure/identity', () => ({
-  DefaultAzureCredential: jest.fn(),
+  AzureCliCredential: jest.fn(),
+  ChainedTokenCredential: jest.fn(),
+  EnvironmentCredential: jest.fn(),
+  ManagedIdentityCredential: jest.fn(),
+  WorkloadIdentityCredential: jest.fn(),
 }));
 
 // Mock Octokit
@@ -59,6 +80,20 @@ const mockOctokit = {
   },
 } as unknown as Octokit;
 
+// Mock a repository with no files and an agent that accepts threads and messages
+const mockMinimalRepoAndAgent = () => {
+  mockGetContent.mockRejectedValue(new Error('File not found'));
+  mockGetRepo.mockResolvedValue({ data: { topics: [], visibility: 'public', license: null } });
+  mockListCommits.mockResolvedValue({ data: [] });
+  mockListPulls.mockResolvedValue({ data: [] });
+  mockListIssues.mockResolvedValue({ data: [] });
+
+  mockCreateAgent.mockResolvedValue({ id: 'agent-123', name: 'DevEx Scorecard Analyzer' });
+  mockCreateThread.mockResolvedValue({ id: 'thread-456' });
+  mockCreateMessage.mockResolvedValue({ id: 'msg-789' });
+  mockDeleteThread.mockResolvedValue({ status: 'deleted' });
+};
+
 describe('AgentService', () => {
   let agentService: AgentService;
   const mockConfig = {
@@ -79,7 +114,7 @@ describe('AgentService', () => {
     mockCreateThread.mockClear();
     mockCreateMessage.mockClear();
     mockDeleteThread.mockClear();
-    mockCreateAndPoll.mockClear();
+    mockCreateRun.mockClear();
     mockListMessages.mockClear();
   });
 
@@ -128,45 +163,37 @@ describe('AgentService', () => {
             
             if (path === 'README.md') {
               return Promise.resolve({
-                data: {
-                  content: Buffer.from('# Test Repository\nThis is a comprehensive test README with setup instructions.').toString('base64'),
-                },
+                data: '# Test Repository\nThis is a comprehensive test README with setup instructions.',
               });
             }
             
             if (path === 'CODEOWNERS') {
               return Promise.resolve({
-                data: {
-                  content: Buffer.from('* @team-lead @maintainer').toString('base64'),
-                },
+                data: '* @team-lead @maintainer',
               });
             }
             
             if (path === '.gitignore') {
               return Promise.resolve({
-                data: {
-                  content: Buffer.from('node_modules/\n.env\n*.log').toString('base64'),
-                },
+                data: 'node_modules/\n.env\n*.log',
               });
             }
             
             if (path === 'package.json') {
               return Promise.resolve({
-                data: {
-                  content: Buffer.from(JSON.stringify({
-                    name: 'test-repo',
-                    version: '1.0.0',
-                    scripts: {
-                      test: 'jest',
-                      build: 'tsc',
-                    },
-                    dependencies: {},
-                    devDependencies: {
-                      jest: '^29.0.0',
-                      typescript: '^4.9.0',
-                    },
-                  })).toString('base64'),
-                },
+                data: JSON.stringify({
+                  name: 'test-repo',
+                  version: '1.0.0',
+                  scripts: {
+                    test: 'jest',
+                    build: 'tsc',
+                  },
+                  dependencies: {},
+                  devDependencies: {
+                    jest: '^29.0.0',
+                    typescript: '^4.9.0',
+                  },
+                }),
               });
             }
             
@@ -181,9 +208,7 @@ describe('AgentService', () => {
             
             if (path === '.github/workflows/ci.yml') {
               return Promise.resolve({
-                data: {
-                  content: Buffer.from('name: CI\non: [push, pull_request]\njobs:\n  test:\n    runs-on: ubuntu-latest\n    steps:\n      - uses: actions/checkout@v3\n      - run: npm test').toString('base64'),
-                },
+                data: 'name: CI\non: [push, pull_request]\njobs:\n  test:\n    runs-on: ubuntu-latest\n    steps:\n      - uses: actions/checkout@v3\n      - run: npm test',
               });
             }
             
@@ -297,13 +322,6 @@ describe('AgentService', () => {
       // Mock message creation
       mockCreateMessage.mockResolvedValue({ id: 'msg-789' });
 
-      // Mock successful run completion
-      const mockCompletedRun = { status: 'completed', id: 'run-abc' };
-      const mockPoller = {
-        pollUntilDone: jest.fn().mockResolvedValue(mockCompletedRun)
-      };
-      mockCreateAndPoll.mockReturnValue(mockPoller);
-
       // Mock assistant response message
       const mockMessages = [
         {
@@ -331,14 +349,7 @@ describe('AgentService', () => {
         }
       ];
 
-      // Mock async iterator for messages
-      mockListMessages.mockReturnValue({
-        [Symbol.asyncIterator]: async function* () {
-          for (const message of mockMessages) {
-            yield message;
-          }
-        }
-      });
+      mockRunStream(mockMessages);
 
       // Mock thread cleanup
       mockDeleteThread.mockResolvedValue({ status: 'deleted' });
@@ -362,6 +373,7 @@ describe('AgentService', () => {
         owner: 'test-owner',
         repo: 'test-repo',
         path: 'README.md',
+        mediaType: { format: 'raw' },
       });
       
       expect(mockGetRepo).toHaveBeenCalledWith({
@@ -385,7 +397,7 @@ describe('AgentService', () => {
       
       expect(mockCreateThread).toHaveBeenCalled();
       expect(mockCreateMessage).toHaveBeenCalledWith('thread-456', 'user', expect.stringContaining('Repository: test-owner/test-repo'));
-      expect(mockCreateAndPoll).toHaveBeenCalledWith('thread-456', 'agent-123', expect.objectContaining({
+      expect(mockCreateRun).toHaveBeenCalledWith('thread-456', 'agent-123', expect.objectContaining({
         maxCompletionTokens: 2500,
         temperature: 0.2
       }));
@@ -432,12 +444,6 @@ describe('AgentService', () => {
       mockCreateThread.mockResolvedValue(mockThread);
       
       mockCreateMessage.mockResolvedValue({ id: 'msg-789' });
-      
-      const mockCompletedRun = { status: 'completed', id: 'run-abc' };
-      const mockPoller = {
-        pollUntilDone: jest.fn().mockResolvedValue(mockCompletedRun)
-      };
-      mockCreateAndPoll.mockReturnValue(mockPoller);
 
       // Mock assistant response for minimal repo
       const mockMessages = [
@@ -463,13 +469,7 @@ describe('AgentService', () => {
         }
       ];
 
-      mockListMessages.mockReturnValue({
-        [Symbol.asyncIterator]: async function* () {
-          for (const message of mockMessages) {
-            yield message;
-          }
-        }
-      });
+      mockRunStream(mockMessages);
 
       mockDeleteThread.mockResolvedValue({ status: 'deleted' });
 
@@ -491,7 +491,7 @@ describe('AgentService', () => {
       mockGetContent.mockImplementation((params) => {
         if (params.path === 'README.md') {
           return Promise.resolve({
-            data: { content: Buffer.from('# Test Repository').toString('base64') },
+            data: '# Test Repository',
           });
         }
         throw new Error('File not found');
@@ -537,7 +537,7 @@ describe('AgentService', () => {
       mockGetContent.mockImplementation((params) => {
         if (params.path === 'README.md') {
           return Promise.resolve({
-            data: { content: Buffer.from('# Test Repository').toString('base64') },
+            data: '# Test Repository',
           });
         }
         throw new Error('File not found');
@@ -578,12 +578,6 @@ describe('AgentService', () => {
       mockCreateThread.mockResolvedValue(mockThread);
       
       mockCreateMessage.mockResolvedValue({ id: 'msg-789' });
-      
-      const mockCompletedRun = { status: 'completed', id: 'run-abc' };
-      const mockPoller = {
-        pollUntilDone: jest.fn().mockResolvedValue(mockCompletedRun)
-      };
-      mockCreateAndPoll.mockReturnValue(mockPoller);
 
       // Mock malformed agent response
       const mockMessages = [
@@ -598,13 +592,7 @@ describe('AgentService', () => {
         }
       ];
 
-      mockListMessages.mockReturnValue({
-        [Symbol.asyncIterator]: async function* () {
-          for (const message of mockMessages) {
-            yield message;
-          }
-        }
-      });
+      mockRunStream(mockMessages);
 
       mockDeleteThread.mockResolvedValue({ status: 'deleted' });
 
@@ -619,12 +607,65 @@ describe('AgentService', () => {
       });
     });
 
+    it('should reuse repository context for repeated scorecards of the same repository', async () => {
+      mockMinimalRepoAndAgent();
+      mockRunStream([{
+        role: 'assistant',
+        content: [{ type: 'text', text: { value: JSON.stringify({ score: 60, color: 'yellow', analysis: 'OK', recommendations: [] }) } }]
+      }]);
+
+      await agentService.generateScorecard(mockOctokit, 'test-owner', 'test-repo');
+      await agentService.generateScorecard(mockOctokit, 'test-owner', 'test-repo');
+
+      expect(mockGetRepo).toHaveBeenCalledTimes(1);
+      expect(mockCreateThread).toHaveBeenCalledTimes(2);
+      expect(mockCreateAgent).toHaveBeenCalledTimes(1);
+
+      agentService.clearContextCache();
+      await agentService.generateScorecard(mockOctokit, 'test-owner', 'test-repo');
+
+      expect(mockGetRepo).toHaveBeenCalledTimes(2);
+    });
+
+    it('should retry agent creation after a failed attempt', async () => {
+      mockMinimalRepoAndAgent();
+      mockCreateAgent
+        .mockRejectedValueOnce(new Error('Agent creation failed'))
+        .mockResolvedValueOnce({ id: 'agent-123', name: 'DevEx Scorecard Analyzer' });
+      mockRunStream([{
+        role: 'assistant',
+        content: [{ type: 'text', text: { value: JSON.stringify({ score: 60, color: 'yellow', analysis: 'OK', recommendations: [] }) } }]
+      }]);
+
+      await expect(
+        agentService.generateScorecard(mockOctokit, 'test-owner', 'test-repo')
+      ).rejects.toThrow('Agent creation failed');
+
+      const result = await agentService.generateScorecard(mockOctokit, 'test-owner', 'test-repo');
+
+      expect(result.score).toBe(60);
+      expect(mockCreateAgent).toHaveBeenCalledTimes(2);
+    });
+
+    it('should refetch repository context when a refresh is requested', async () => {
+      mockMinimalRepoAndAgent();
+      mockRunStream([{
+        role: 'assistant',
+        content: [{ type: 'text', text: { value: JSON.stringify({ score: 60, color: 'yellow', analysis: 'OK', recommendations: [] }) } }]
+      }]);
+
+      await agentService.generateScorecard(mockOctokit, 'test-owner', 'test-repo');
+      await agentService.generateScorecard(mockOctokit, 'test-owner', 'test-repo', { refreshContext: true });
+
+      expect(mockGetRepo).toHaveBeenCalledTimes(2);
+    });
+
     it('should handle empty Agent response', async () => {
       // Mock basic GitHub API responses
       mockGetContent.mockImplementation((params) => {
         if (params.path === 'README.md') {
           return Promise.resolve({
-            data: { content: Buffer.from('# Test Repository').toString('base64') },
+            data: '# Test Repository',
           });
         }
         throw new Error('File not found');
@@ -665,16 +706,11 @@ describe('AgentService', () => {
       mockCreateThread.mockResolvedValue(mockThread);
       
       mockCreateMessage.mockResolvedValue({ id: 'msg-789' });
-      
-      const mockCompletedRun = { status: 'completed', id: 'run-abc' };
-      const mockPoller = {
-        pollUntilDone: jest.fn().mockResolvedValue(mockCompletedRun)
-      };
-      mockCreateAndPoll.mockReturnValue(mockPoller);
 
-      // Mock empty messages (no assistant response)
+      // Mock empty messages (no assistant response) in both the stream and the thread
       const mockMessages: any[] = [];
 
+      mockRunStream(mockMessages);
       mockListMessages.mockReturnValue({
         [Symbol.asyncIterator]: async function* () {
           for (const message of mockMessages) {
@@ -686,6 +722,74 @@ describe('AgentService', () => {
       await expect(
         agentService.generateScorecard(mockOctokit, 'test-owner', 'test-repo')
       ).rejects.toThrow('No response from AI agent');
+      expect(mockListMessages).toHaveBeenCalledWith('thread-456', {
+        runId: 'run-abc',
+        order: 'desc',
+        limit: 1,
+      });
+    });
+
+    it('should stop reading the stream once the run completes', async () => {
+      mockMinimalRepoAndAgent();
+
+      const assistantMessage = {
+        role: 'assistant',
+        content: [{ type: 'text', text: { value: JSON.stringify({ score: 70, color: 'green', analysis: 'Good', recommendations: ['Keep going'] }) } }]
+      };
+      const trailingEvent = jest.fn();
+      mockCreateRun.mockReturnValue({
+        stream: jest.fn().mockResolvedValue({
+          [Symbol.asyncIterator]: async function* () {
+            yield { event: MessageStreamEvent.ThreadMessageCompleted, data: assistantMessage };
+            yield { event: RunStreamEvent.ThreadRunCompleted, data: { id: 'run-abc', status: 'completed' } };
+            trailingEvent();
+            yield { event: DoneEvent.Done, data: '[DONE]' };
+          },
+        }),
+      });
+
+      const result = await agentService.generateScorecard(mockOctokit, 'test-owner', 'test-repo');
+
+      expect(result.score).toBe(70);
+      expect(trailingEvent).not.toHaveBeenCalled();
+      expect(mockListMessages).not.toHaveBeenCalled();
+    });
+
+    it('should fail when the streamed run fails', async () => {
+      mockMinimalRepoAndAgent();
+      mockCreateRun.mockReturnValue({
+        stream: jest.fn().mockResolvedValue({
+          [Symbol.asyncIterator]: async function* () {
+            yield { event: RunStreamEvent.ThreadRunFailed, data: { id: 'run-abc', status: 'failed' } };
+          },
+        }),
+      });
+
+      await expect(
+        agentService.generateScorecard(mockOctokit, 'test-owner', 'test-repo')
+      ).rejects.toThrow('Agent run failed with status: failed');
+      expect(mockDeleteThread).toHaveBeenCalledWith('thread-456');
+    });
+
+    it('should fail when the stream ends before the run completes', async () => {
+      mockMinimalRepoAndAgent();
+      mockCreateRun.mockReturnValue({
+        stream: jest.fn().mockResolvedValue({
+          [Symbol.asyncIterator]: async function* () {
+            yield { event: RunStreamEvent.ThreadRunCreated, data: { id: 'run-abc', status: 'queued' } };
+            yield {
+              event: MessageStreamEvent.ThreadMessageCompleted,
+              data: { role: 'assistant', content: [{ type: 'text', text: { value: '{"score": 7' } }] },
+            };
+          },
+        }),
+      });
+
+      await expect(
+        agentService.generateScorecard(mockOctokit, 'test-owner', 'test-repo')
+      ).rejects.toThrow('Agent run failed: stream ended before the run completed');
+      expect(mockListMessages).not.toHaveBeenCalled();
+      expect(mockDeleteThread).toHaveBeenCalledWith('thread-456');
     });
   });
-});
\ No newline at end of file
+});
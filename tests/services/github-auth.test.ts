@@ -4,7 +4,9 @@ jest.mock('fs', () => ({
 }));
 
 jest.mock('@octokit/rest', () => ({
-  Octokit: jest.fn(),
+  Octokit: jest.fn().mockImplementation(() => ({
+    hook: { wrap: jest.fn() },
+  })),
 }));
 
 jest.mock('@octokit/auth-app', () => ({
@@ -166,5 +168,18 @@ describe('GitHubAuthService', () => {
         },
       });
     });
+
+    it('should reuse the Octokit instance for the same installation', async () => {
+      const first = await service.getInstallationOctokit(42);
+      const second = await service.getInstallationOctokit(42);
+      const other = await service.getInstallationOctokit(43);
+
+      expect(second).toBe(first);
+      expect(other).not.toBe(first);
+
+      const installationCalls = (Octokit as unknown as jest.Mock).mock.calls
+        .filter(([options]) => options.auth.installationId === 42);
+      expect(installationCalls).toHaveLength(1);
+    });
   });
 });
\ No newline at end of file
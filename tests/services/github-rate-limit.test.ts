@@ -0,0 +1,132 @@
+import { Octokit } from '@octokit/rest';
+import { enableRateLimitHandling, RateLimitOptions } from '../../src/services/github-rate-limit';
+
+describe('enableRateLimitHandling', () => {
+  let wrapper: (request: any, options: any) => Promise<any>;
+  const mockRequest = jest.fn();
+  const requestOptions = { method: 'GET', url: '/repos/{owner}/{repo}/contents/{path}' };
+
+  const options: RateLimitOptions = {
+    maxRetries: 2,
+    baseDelayMs: 1,
+    minRemaining: 10,
+    maxWaitMs: 60 * 1000,
+  };
+
+  const rateLimitError = (status: number, headers: Record<string, string> = {}) =>
+    Object.assign(new Error('API rate limit exceeded'), { status, response: { headers } });
+
+  beforeEach(() => {
+    jest.clearAllMocks();
+    mockRequest.mockReset();
+
+    const octokit = {
+      hook: {
+        wrap: jest.fn((_name, fn) => {
+          wrapper = fn;
+        }),
+      },
+    } as unknown as Octokit;
+
+    enableRateLimitHandling(octokit, options);
+  });
+
+  afterEach(() => {
+    jest.useRealTimers();
+  });
+
+  it('should retry rate-limited requests with backoff', async () => {
+    const response = { status: 200, headers: {}, data: 'ok' };
+    mockRequest
+      .mockRejectedValueOnce(rateLimitError(429))
+      .mockRejectedValueOnce(rateLimitError(403, { 'x-ratelimit-remaining': '0' }))
+      .mockResolvedValueOnce(response);
+
+    await expect(wrapper(mockRequest, requestOptions)).resolves.toBe(response);
+    expect(mockRequest).toHaveBeenCalledTimes(3);
+  });
+
+  it('should give up after the maximum number of retries', async () => {
+    mockRequest.mockRejectedValue(rateLimitError(429));
+
+    await expect(wrapper(mockRequest, requestOptions)).rejects.toThrow('API rate limit exceeded');
+    expect(mockRequest).toHaveBeenCalledTimes(options.maxRetries + 1);
+  });
+
+  it('should not retry other errors', async () => {
+    mockRequest.mockRejectedValue(Object.assign(new Error('Not Found'), { status: 404 }));
+
+    await expect(wrapper(mockRequest, requestOptions)).rejects.toThrow('Not Found');
+    expect(mockRequest).toHaveBeenCalledTimes(1);
+  });
+
+  it('should pause requests until the window resets when quota runs low', async () => {
+    jest.useFakeTimers({ now: 1_700_000_000_000 });
+    const resetSeconds = Math.floor(Date.now() / 1000) + 30;
+
+    mockRequest
+      .mockResolvedValueOnce({
+        status: 200,
+        headers: { 'x-ratelimit-remaining': '5', 'x-ratelimit-reset': String(resetSeconds) },
+        data: 'first',
+      })
+      .mockResolvedValueOnce({ status: 200, headers: {}, data: 'second' });
+
+    await wrapper(mockRequest, requestOptions);
+
+    const second = wrapper(mockRequest, requestOptions);
+    await jest.advanceTimersByTimeAsync(29 * 1000);
+    expect(mockRequest).toHaveBeenCalledTimes(1);
+
+    await jest.advanceTimersByTimeAsync(1000);
+    await expect(second).resolves.toEqual(expect.objectContaining({ data: 'second' }));
+    expect(mockRequest).toHaveBeenCalledTimes(2);
+  });
+
+  it('should only pause requests drawing on the exhausted resource', async () => {
+    jest.useFakeTimers({ now: 1_700_000_000_000 });
+    const resetSeconds = Math.floor(Date.now() / 1000) + 30;
+
+    mockRequest
+      .mockResolvedValueOnce({
+        status: 200,
+        headers: {
+          'x-ratelimit-remaining': '5',
+          'x-ratelimit-reset': String(resetSeconds),
+          'x-ratelimit-resource': 'graphql',
+        },
+        data: 'graphql',
+      })
+      .mockResolvedValueOnce({ status: 200, headers: {}, data: 'rest' });
+
+    await wrapper(mockRequest, { method: 'POST', url: '/graphql' });
+
+    await expect(wrapper(mockRequest, requestOptions)).resolves.toEqual(expect.objectContaining({ data: 'rest' }));
+    expect(mockRequest).toHaveBeenCalledTimes(2);
+  });
+
+  it('should fail fast when the exhausted quota resets beyond the maximum wait', async () => {
+    const resetSeconds = Math.floor(Date.now() / 1000) + 30 * 60;
+    mockRequest.mockRejectedValue(rateLimitError(403, {
+      'x-ratelimit-remaining': '0',
+      'x-ratelimit-reset': String(resetSeconds),
+    }));
+
+    await expect(wrapper(mockRequest, requestOptions)).rejects.toThrow('API rate limit exceeded');
+    expect(mockRequest).toHaveBeenCalledTimes(1);
+  });
+
+  it('should fail fast while the quota is paused beyond the maximum wait', async () => {
+    const resetSeconds = Math.floor(Date.now() / 1000) + 30 * 60;
+    mockRequest.mockResolvedValueOnce({
+      status: 200,
+      headers: { 'x-ratelimit-remaining': '5', 'x-ratelimit-reset': String(resetSeconds) },
+      data: 'first',
+    });
+
+    await wrapper(mockRequest, requestOptions);
+
+    await expect(wrapper(mockRequest, requestOptions)).rejects.toThrow('GitHub core rate limit paused');
+    expect(mockRequest).toHaveBeenCalledTimes(1);
+  });
+});
@@ -0,0 +1,107 @@
+import { Octokit } from '@octokit/rest';
+import { GitHubRepositoryService } from '../../src/services/github-repository';
+
+describe('GitHubRepositoryService', () => {
+  const mockGraphql = jest.fn();
+  const mockGetContent = jest.fn();
+  const mockGetTree = jest.fn();
+  const mockGetBlob = jest.fn();
+
+  const mockOctokit = {
+    graphql: mockGraphql,
+    rest: {
+      repos: {
+        getContent: mockGetContent,
+      },
+      git: {
+        getTree: mockGetTree,
+        getBlob: mockGetBlob,
+      },
+    },
+  } as unknown as Octokit;
+
+  let service: GitHubRepositoryService;
+
+  beforeEach(() => {
+    jest.clearAllMocks();
+    service = new GitHubRepositoryService(mockOctokit);
+  });
+
+  describe('fetchFiles', () => {
+    it('should fetch all files in a single GraphQL query', async () => {
+      mockGraphql.mockResolvedValue({
+        repository: {
+          file0: { text: '# Test Repository' },
+          file1: null,
+        },
+      });
+
+      const result = await service.fetchFiles('test-owner', 'test-repo', ['README.md', 'CODEOWNERS']);
+
+      expect(result).toEqual([
+        { filename: 'README.md', content: '# Test Repository' },
+        { filename: 'CODEOWNERS', content: null },
+      ]);
+      expect(mockGraphql).toHaveBeenCalledTimes(1);
+      expect(mockGraphql).toHaveBeenCalledWith(
+        expect.stringContaining('file0: object(expression: "HEAD:README.md")'),
+        { owner: 'test-owner', repo: 'test-repo' }
+      );
+      expect(mockGetContent).not.toHaveBeenCalled();
+    });
+
+    it('should fetch present files as blobs when the GraphQL query fails', async () => {
+      mockGraphql.mockRejectedValue(new Error('GraphQL unavailable'));
+      mockGetTree.mockResolvedValue({
+        data: {
+          truncated: false,
+          tree: [
+            { path: 'README.md', type: 'blob', sha: 'readme-sha' },
+            { path: 'src', type: 'tree', sha: 'src-sha' },
+          ],
+        },
+      });
+      mockGetBlob.mockResolvedValue({ data: '# Test Repository' });
+
+      const result = await service.fetchFiles('test-owner', 'test-repo', ['README.md', 'CODEOWNERS']);
+
+      expect(result).toEqual([
+        { filename: 'README.md', content: '# Test Repository' },
+        { filename: 'CODEOWNERS', content: null },
+      ]);
+      expect(mockGetTree).toHaveBeenCalledWith({
+        owner: 'test-owner',
+        repo: 'test-repo',
+        tree_sha: 'HEAD',
+        recursive: 'true',
+      });
+      expect(mockGetBlob).toHaveBeenCalledTimes(1);
+      expect(mockGetContent).not.toHaveBeenCalled();
+
+      // Blobs are immutable, so the same SHA is served from cache
+      await service.fetchFiles('test-owner', 'test-repo', ['README.md']);
+      expect(mockGetBlob).toHaveBeenCalledTimes(1);
+    });
+
+    it('should fall back to per-file REST when GraphQL and the tree are unavailable', async () => {
+      mockGraphql.mockRejectedValue(new Error('GraphQL unavailable'));
+      mockGetTree.mockResolvedValue({ data: { truncated: true, tree: [] } });
+      mockGetContent.mockImplementation(({ path }) => {
+        if (path === 'README.md') {
+          return Promise.resolve({
+            data: '# Test Repository',
+          });
+        }
+        throw new Error('Not Found');
+      });
+
+      const result = await service.fetchFiles('test-owner', 'test-repo', ['README.md', 'CODEOWNERS']);
+
+      expect(result).toEqual([
+        { filename: 'README.md', content: '# Test Repository' },
+        { filename: 'CODEOWNERS', content: null },
+      ]);
+      expect(mockGetContent).toHaveBeenCalledTimes(2);
+    });
+  });
+});
@@ -0,0 +1,144 @@
+import { Octokit } from '@octokit/rest';
+import { ConditionalRequestCache, enableConditionalRequests } from '../../src/services/github-request-cache';
+
+describe('github-request-cache', () => {
+  describe('ConditionalRequestCache', () => {
+    it('should evict the least recently used entry when full', () => {
+      const cache = new ConditionalRequestCache(2);
+
+      cache.set('a', { etag: '"a"', response: 'A' });
+      cache.set('b', { etag: '"b"', response: 'B' });
+      cache.get('a');
+      cache.set('c', { etag: '"c"', response: 'C' });
+
+      expect(cache.size).toBe(2);
+      expect(cache.get('a')).toBeDefined();
+      expect(cache.get('b')).toBeUndefined();
+      expect(cache.get('c')).toBeDefined();
+    });
+  });
+
+  describe('enableConditionalRequests', () => {
+    let wrapper: (request: any, options: any) => Promise<any>;
+    let mockRequest: jest.Mock;
+    let cache: ConditionalRequestCache;
+
+    const getOptions = () => ({
+      method: 'GET',
+      url: '/repos/{owner}/{repo}/contents/{path}',
+      owner: 'test-owner',
+      repo: 'test-repo',
+      path: 'README.md',
+      headers: { accept: 'application/vnd.github.v3+json' } as Record<string, string>,
+    });
+
+    beforeEach(() => {
+      const octokit = {
+        hook: {
+          wrap: jest.fn((_name, fn) => {
+            wrapper = fn;
+          }),
+        },
+        request: {
+          endpoint: {
+            parse: (options: any) => ({
+              method: options.method,
+              url: `https://api.github.com/repos/${options.owner}/${options.repo}/contents/${options.path}`,
+              headers: options.headers,
+            }),
+          },
+        },
+      } as unknown as Octokit;
+
+      mockRequest = jest.fn();
+
+      cache = new ConditionalRequestCache();
+      enableConditionalRequests(octokit, cache);
+    });
+
+    it('should send If-None-Match and return the cached response on 304', async () => {
+      const firstResponse = { status: 200, headers: { etag: '"abc"' }, data: { content: 'readme' } };
+      mockRequest.mockResolvedValueOnce(firstResponse);
+
+      expect(await wrapper(mockRequest, getOptions())).toBe(firstResponse);
+
+      mockRequest.mockRejectedValueOnce(Object.assign(new Error('Not modified'), {
+        status: 304,
+        response: { headers: { etag: '"abc"', 'x-ratelimit-remaining': '4999' } },
+      }));
+      const secondOptions = getOptions();
+
+      expect(await wrapper(mockRequest, secondOptions)).toEqual({
+        ...firstResponse,
+        headers: { etag: '"abc"', 'x-ratelimit-remaining': '4999' },
+      });
+      expect(secondOptions.headers['if-none-match']).toBe('"abc"');
+    });
+
+    it('should not cache non-GET requests', async () => {
+      mockRequest.mockResolvedValue({ status: 201, headers: { etag: '"abc"' }, data: {} });
+
+      await wrapper(mockRequest, { ...getOptions(), method: 'POST' });
+
+      expect(cache.size).toBe(0);
+    });
+
+    it('should keep entries from differently scoped clients apart', async () => {
+      let scopedWrapper: (request: any, options: any) => Promise<any> = wrapper;
+      const scopedOctokit = {
+        hook: { wrap: jest.fn((_name, fn) => { scopedWrapper = fn; }) },
+        request: { endpoint: { parse: (options: any) => ({ url: options.url, headers: options.headers }) } },
+      } as unknown as Octokit;
+      enableConditionalRequests(scopedOctokit, cache, 'installation:2');
+
+      mockRequest.mockResolvedValue({ status: 200, headers: { etag: '"abc"' }, data: {} });
+      await wrapper(mockRequest, getOptions());
+      const scopedOptions = getOptions();
+      await scopedWrapper(mockRequest, scopedOptions);
+
+      expect(cache.size).toBe(2);
+      expect(scopedOptions.headers['if-none-match']).toBeUndefined();
+    });
+
+    it('should rethrow errors other than 304', async () => {
+      mockRequest.mockResolvedValueOnce({ status: 200, headers: { etag: '"abc"' }, data: {} });
+      await wrapper(mockRequest, getOptions());
+
+      mockRequest.mockRejectedValueOnce(Object.assign(new Error('Not Found'), { status: 404 }));
+
+      await expect(wrapper(mockRequest, getOptions())).rejects.toThrow('Not Found');
+    });
+  });
+
+  describe('with a real Octokit client', () => {
+    // Stands in for createAppAuth: registers its own request hook first, so the
+    // conditional request hook receives a bound hook rather than the raw request
+    const authStrategy = () => Object.assign(
+      async () => ({ type: 'token', token: 'test-token' }),
+      { hook: (request: any, options: any) => request(options) }
+    );
+
+    it('should revalidate and serve the cached response behind an auth hook', async () => {
+      const mockFetch = jest.fn()
+        .mockResolvedValueOnce(new Response(JSON.stringify({ name: 'test-repo' }), {
+          status: 200,
+          headers: { 'content-type': 'application/json', etag: '"abc"' },
+        }))
+        .mockResolvedValueOnce(new Response(null, {
+          status: 304,
+          headers: { etag: '"abc"' },
+        }));
+
+      const octokit = new Octokit({ authStrategy, request: { fetch: mockFetch } });
+      enableConditionalRequests(octokit, new ConditionalRequestCache());
+
+      const first = await octokit.rest.repos.get({ owner: 'test-owner', repo: 'test-repo' });
+      const second = await octokit.rest.repos.get({ owner: 'test-owner', repo: 'test-repo' });
+
+      expect(first.data).toEqual({ name: 'test-repo' });
+      expect(second.data).toEqual({ name: 'test-repo' });
+      expect(mockFetch).toHaveBeenCalledTimes(2);
+      expect(mockFetch.mock.calls[1][1].headers['if-none-match']).toBe('"abc"');
+    });
+  });
+});
@@ -220,5 +220,23 @@ describe('IssueManagerService', () => {
         body: expect.stringContaining('Scorecard re-run completed')
       });
     });
+
+    it('should request fresh repository context for a rerun', async () => {
+      mockOctokit.rest.issues.update.mockResolvedValue({ data: {} });
+      mockOctokit.rest.issues.createComment.mockResolvedValue({ data: {} });
+      const aiService = new IssueManagerService({
+        projectEndpoint: 'https://test-azure-endpoint.azure.com/',
+        deploymentName: 'test-gpt-model',
+      });
+
+      await aiService.handleScorecardRerun(mockRepository, mockIssue, 12345);
+
+      expect(mockAgentService.generateScorecard).toHaveBeenCalledWith(
+        mockOctokit,
+        'owner',
+        'test-repo',
+        { refreshContext: true }
+      );
+    });
   });
 });
\ No newline at end of file